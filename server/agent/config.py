@@ -7,6 +7,10 @@ AWS_REGION = "us-east-1"
 BEDROCK_MODEL_ID = "us.anthropic.claude-3-7-sonnet-20250219-v1:0"
 MODEL_TEMPERATURE = 0.3
 
+# Prompt Caching Configuration (True for the default TTL, a TTL string such as "1h", or False to disable)
+MODEL_CACHE_PROMPT = True
+MODEL_CACHE_TOOLS = True
+
 # S3 Configuration
 S3_SESSION_BUCKET = "zk-aws-mcp-assistant-sessions"
 
@@ -17,3 +21,4 @@ WEB_UI_PORT = 3000
 
 # Tool Configuration
 STRANDS_AUTO_APPROVE_TOOLS = "true"
+PREWARM_TOOLS = True
@@ -3,18 +3,23 @@
 import json
 import asyncio
 
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
+
+
+def dumps(data, default=None) -> str:
+    """Serialize to a JSON string, using orjson when it is installed"""
+    if orjson is not None:
+        # Leave dataclasses (e.g. AgentResult) and datetimes to `default`, as the stdlib encoder does
+        option = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(data, default=default, option=option).decode()
+    return json.dumps(data, default=default)
+
 
 class AgentFormatter:
-    """Input/Output formatter for AWS Agents"""
-    
-    @staticmethod
-    def format_request(prompt: str, session_id: str) -> dict:
-        """Format incoming request for the agent"""
-        return {
-            "prompt": prompt,
-            "session_id": session_id,
-            "timestamp": asyncio.get_event_loop().time()
-        }
+    """Output formatter for AWS Agents"""
     
     @staticmethod
     def format_response_chunk(event_data: dict, session_id: str) -> str:
@@ -25,23 +30,30 @@ class AgentFormatter:
         elif not isinstance(event_data, dict):
             event_data = {"content": str(event_data)}
         
-        # Remove non-serializable objects
+        formatted_event = {
+            "event": event_data,
+            "session_id": session_id,
+            "timestamp": asyncio.get_event_loop().time()
+        }
+        
+        try:
+            # Serialize in a single pass, converting non-serializable values to strings
+            return f"data: {dumps(formatted_event, default=str)}\n\n"
+        except (TypeError, ValueError):
+            pass
+        
+        # Slow path: stringify whichever top-level values still fail to serialize
         serializable_data = {}
         for key, value in event_data.items():
             try:
-                json.dumps(value)  # Test if serializable
+                dumps(value, default=str)
                 serializable_data[key] = value
             except (TypeError, ValueError):
-                serializable_data[key] = str(value)  # Convert to string if not serializable
-        
-        formatted_event = {
-            "event": serializable_data,
-            "session_id": session_id,
-            "timestamp": asyncio.get_event_loop().time()
-        }
+                serializable_data[key] = str(value)
+        formatted_event["event"] = serializable_data
         
         try:
-            return f"data: {json.dumps(formatted_event)}\n\n"
+            return f"data: {dumps(formatted_event, default=str)}\n\n"
         except (TypeError, ValueError) as e:
             # Fallback for any remaining serialization issues
             error_event = {
@@ -49,7 +61,7 @@ class AgentFormatter:
                 "session_id": session_id,
                 "timestamp": asyncio.get_event_loop().time()
             }
-            return f"data: {json.dumps(error_event)}\n\n"
+            return f"data: {dumps(error_event)}\n\n"
     
     @staticmethod
     def format_error(error: Exception, session_id: str) -> str:
@@ -60,4 +72,4 @@ class AgentFormatter:
             "session_id": session_id,
             "timestamp": asyncio.get_event_loop().time()
         }
-        return f"data: {json.dumps(error_event)}\n\n"
+        return f"data: {dumps(error_event)}\n\n"
@@ -10,37 +10,92 @@ This script handles:
 
 Prerequisites:
 - AWS CLI configured
-- Docker installed and running
+- Docker installed and running, with the buildx plugin on BuildKit 0.12+
+  (registry cache export needs a docker-container builder; one named
+  agentcore-builder is created automatically when the active builder uses
+  the default docker driver)
 - Appropriate IAM permissions
 """
 
+import base64
 import boto3
+import concurrent.futures
+import hashlib
 import json
 import os
+import random
 import subprocess
 import sys
+import tempfile
 import time
+from pathlib import Path
 from typing import Optional
 
+from botocore.config import Config
+
+STS_CACHE_DIR = Path.home() / ".cache" / "agentcore"
+STS_CACHE_TTL = 24 * 60 * 60
+BUILDX_BUILDER = "agentcore-builder"
+
 class AgentCoreDeployer:
     def __init__(self, 
                  agent_name: str = "aws-assistant-mcp",
                  region: str = "us-east-1",
-                 execution_role_arn: Optional[str] = None):
+                 execution_role_arn: Optional[str] = None,
+                 session_bucket: str = "zk-aws-mcp-assistant-sessions"):
         self.agent_name = agent_name
         self.region = region
         self.execution_role_arn = execution_role_arn
+        self.session_bucket = session_bucket
         
-        # Initialize AWS clients
-        self.ecr_client = boto3.client('ecr', region_name=region)
-        self.agentcore_client = boto3.client('bedrock-agentcore-control', region_name=region)
-        self.sts_client = boto3.client('sts', region_name=region)
+        # Initialize AWS clients from one session so they share credential resolution and config.
+        # Clients are created up front because boto3 sessions aren't safe to use across threads.
+        self._session = boto3.session.Session(region_name=region)
+        self._config = Config(
+            retries={'max_attempts': 10, 'mode': 'adaptive'},
+            max_pool_connections=32,
+            connect_timeout=3,
+            read_timeout=15
+        )
+        self.ecr_client = self._session.client('ecr', config=self._config)
+        self.agentcore_client = self._session.client('bedrock-agentcore-control', config=self._config)
+        self.sts_client = self._session.client('sts', config=self._config)
+        self.iam_client = self._session.client('iam', config=self._config)
         
         # Get account ID
-        self.account_id = self.sts_client.get_caller_identity()['Account']
+        self.account_id = self._get_account_id()
         self.repository_name = f"{agent_name}-repo"
         self.image_uri = f"{self.account_id}.dkr.ecr.{region}.amazonaws.com/{self.repository_name}:latest"
     
+    def _get_account_id(self) -> str:
+        """Return the caller's account ID, cached on disk per profile and access key"""
+        if os.environ.get("AGENTCORE_STS_CACHE", "1") == "0":
+            return self.sts_client.get_caller_identity()['Account']
+        
+        credentials = self._session.get_credentials()
+        access_key = credentials.access_key if credentials else ""
+        cache_key = hashlib.sha256(f"{self._session.profile_name}:{access_key[:12]}".encode()).hexdigest()[:16]
+        cache_file = STS_CACHE_DIR / f"account-{cache_key}.json"
+        
+        try:
+            cached = json.loads(cache_file.read_text())
+            if time.time() - cached['timestamp'] < STS_CACHE_TTL:
+                return cached['account_id']
+        except (OSError, ValueError, KeyError):
+            pass
+        
+        account_id = self.sts_client.get_caller_identity()['Account']
+        
+        try:
+            STS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", dir=STS_CACHE_DIR, delete=False) as f:
+                json.dump({"account_id": account_id, "timestamp": time.time()}, f)
+            os.replace(f.name, cache_file)
+        except OSError as e:
+            print(f"⚠️ Could not cache account ID: {e}")
+        
+        return account_id
+    
     def create_ecr_repository(self):
         """Create ECR repository if it doesn't exist"""
         try:
@@ -54,11 +109,8 @@ class AgentCoreDeployer:
             )
             print(f"✅ Created ECR repository: {self.repository_name}")
     
-    def build_and_push_image(self):
-        """Build Docker image and push to ECR"""
-        print("🔨 Building Docker image...")
-        
-        # Create Dockerfile
+    def _prepare_build_context(self):
+        """Write the Dockerfile for the agent image"""
         dockerfile_content = f"""
 FROM python:3.12-slim
 
@@ -83,41 +135,96 @@ EXPOSE 8080
 CMD ["python", "agentcore_main.py"]
 """
         
-        with open("Dockerfile", "w") as f:
-            f.write(dockerfile_content)
+        # Leave an identical Dockerfile untouched so its mtime doesn't churn the build cache
+        new_content = dockerfile_content.encode()
+        dockerfile = Path("Dockerfile")
+        if dockerfile.exists() and \
+                hashlib.sha256(dockerfile.read_bytes()).digest() == hashlib.sha256(new_content).digest():
+            return
         
-        # Build image
-        build_cmd = ["docker", "build", "-t", self.agent_name, "."]
-        result = subprocess.run(build_cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"❌ Docker build failed: {result.stderr}")
-            return False
+        dockerfile.write_bytes(new_content)
+    
+    def _run_streaming(self, cmd: list, input: Optional[str] = None, env: Optional[dict] = None) -> int:
+        """Run a command echoing its output live and return its exit code"""
+        with subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE if input is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+            env=env
+        ) as proc:
+            if input is not None:
+                proc.stdin.write(input)
+                proc.stdin.close()
+            for line in proc.stdout:
+                print(line, end='')
+        return proc.returncode
+    
+    def _get_cache_capable_builder(self) -> Optional[str]:
+        """Return the buildx builder to use for registry cache export
         
-        print("✅ Docker image built successfully")
+        An empty string means the active builder already supports it; None means no
+        suitable builder is available and the build should run without the cache.
+        """
+        inspect = subprocess.run(["docker", "buildx", "inspect"], capture_output=True, text=True)
+        driver = next(
+            (line.split(":", 1)[1].strip() for line in inspect.stdout.splitlines()
+             if line.startswith("Driver:")),
+            None
+        )
+        if inspect.returncode == 0 and driver != "docker":
+            return ""
         
+        # The default docker driver can't export cache, so build on a docker-container builder
+        if subprocess.run(["docker", "buildx", "inspect", BUILDX_BUILDER],
+                          capture_output=True, text=True).returncode == 0:
+            return BUILDX_BUILDER
+        
+        print(f"🔧 Creating buildx builder {BUILDX_BUILDER} (docker-container driver)...")
+        create = subprocess.run(
+            ["docker", "buildx", "create", "--name", BUILDX_BUILDER, "--driver", "docker-container"],
+            capture_output=True, text=True
+        )
+        if create.returncode != 0:
+            print(f"⚠️ Could not create buildx builder, building without layer cache: {create.stderr.strip()}")
+            return None
+        return BUILDX_BUILDER
+    
+    def build_and_push_image(self):
+        """Build Docker image with BuildKit and push it to ECR"""
         # Get ECR login token
         print("🔐 Getting ECR login token...")
         login_response = self.ecr_client.get_authorization_token()
         token = login_response['authorizationData'][0]['authorizationToken']
         endpoint = login_response['authorizationData'][0]['proxyEndpoint']
+        password = base64.b64decode(token).decode().split(":", 1)[1]
         
-        # Docker login to ECR
+        # Docker login to ECR (needed up front: the build pushes the image and its cache)
         login_cmd = ["docker", "login", "--username", "AWS", "--password-stdin", endpoint]
-        login_process = subprocess.run(login_cmd, input=token, text=True, capture_output=True)
-        if login_process.returncode != 0:
-            print(f"❌ ECR login failed: {login_process.stderr}")
+        returncode = self._run_streaming(login_cmd, input=password)
+        if returncode != 0:
+            print(f"❌ ECR login failed (exit code {returncode})")
             return False
         
-        # Tag image
-        tag_cmd = ["docker", "tag", self.agent_name, self.image_uri]
-        subprocess.run(tag_cmd, check=True)
-        
-        # Push image
-        print("📤 Pushing image to ECR...")
-        push_cmd = ["docker", "push", self.image_uri]
-        result = subprocess.run(push_cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"❌ Docker push failed: {result.stderr}")
+        # Build and push in one step, reusing cached layers stored alongside the image in ECR
+        print("🔨 Building and pushing Docker image...")
+        cache_ref = f"{self.image_uri}-cache"
+        build_cmd = ["docker", "buildx", "build"]
+        builder = self._get_cache_capable_builder()
+        if builder is not None:
+            if builder:
+                build_cmd += ["--builder", builder]
+            build_cmd += [
+                f"--cache-from=type=registry,ref={cache_ref}",
+                f"--cache-to=type=registry,ref={cache_ref},mode=max,image-manifest=true"
+            ]
+        build_cmd += ["--push", "-t", self.image_uri, "."]
+        env = {**os.environ, "DOCKER_BUILDKIT": "1"}
+        returncode = self._run_streaming(build_cmd, env=env)
+        if returncode != 0:
+            print(f"❌ Docker build/push failed (exit code {returncode})")
             return False
         
         print(f"✅ Image pushed successfully: {self.image_uri}")
@@ -128,9 +235,18 @@ CMD ["python", "agentcore_main.py"]
         if self.execution_role_arn:
             return self.execution_role_arn
         
-        iam_client = boto3.client('iam', region_name=self.region)
+        iam_client = self.iam_client
         role_name = f"{self.agent_name}-execution-role"
         
+        # Reuse the role from a previous deploy; only build and create it when missing
+        try:
+            role_arn = iam_client.get_role(RoleName=role_name)['Role']['Arn']
+            print(f"✅ Using existing execution role: {role_arn}")
+            self.execution_role_arn = role_arn
+            return role_arn
+        except iam_client.exceptions.NoSuchEntityException:
+            pass
+        
         # Trust policy for AgentCore
         trust_policy = {
             "Version": "2012-10-17",
@@ -145,20 +261,52 @@ CMD ["python", "agentcore_main.py"]
             ]
         }
         
-        # Basic execution policy
+        # Execution policy: read-only describe/list calls don't support resource scoping,
+        # everything else is limited to the resources the agent actually uses
         execution_policy = {
             "Version": "2012-10-17",
             "Statement": [
                 {
+                    "Sid": "Logs",
                     "Effect": "Allow",
                     "Action": [
                         "logs:CreateLogGroup",
                         "logs:CreateLogStream",
-                        "logs:PutLogEvents",
+                        "logs:PutLogEvents"
+                    ],
+                    "Resource": f"arn:aws:logs:{self.region}:{self.account_id}:log-group:/aws/bedrock-agentcore/runtimes/*"
+                },
+                {
+                    "Sid": "InvokeModels",
+                    "Effect": "Allow",
+                    "Action": [
                         "bedrock:InvokeModel",
-                        "bedrock:InvokeModelWithResponseStream",
+                        "bedrock:InvokeModelWithResponseStream"
+                    ],
+                    "Resource": [
+                        "arn:aws:bedrock:*::foundation-model/anthropic.*",
+                        f"arn:aws:bedrock:*:{self.account_id}:inference-profile/*.anthropic.*"
+                    ]
+                },
+                {
+                    "Sid": "SessionObjects",
+                    "Effect": "Allow",
+                    "Action": [
                         "s3:GetObject",
-                        "s3:PutObject",
+                        "s3:PutObject"
+                    ],
+                    "Resource": f"arn:aws:s3:::{self.session_bucket}/*"
+                },
+                {
+                    "Sid": "SessionBucket",
+                    "Effect": "Allow",
+                    "Action": "s3:ListBucket",
+                    "Resource": f"arn:aws:s3:::{self.session_bucket}"
+                },
+                {
+                    "Sid": "ReadOnlyDescribe",
+                    "Effect": "Allow",
+                    "Action": [
                         "cloudwatch:GetMetricStatistics",
                         "cloudwatch:ListMetrics",
                         "ec2:DescribeInstances",
@@ -169,30 +317,24 @@ CMD ["python", "agentcore_main.py"]
             ]
         }
         
-        try:
-            # Create role
-            role_response = iam_client.create_role(
-                RoleName=role_name,
-                AssumeRolePolicyDocument=json.dumps(trust_policy),
-                Description=f"Execution role for {self.agent_name} AgentCore runtime"
-            )
-            role_arn = role_response['Role']['Arn']
-            
-            # Attach policy
-            iam_client.put_role_policy(
-                RoleName=role_name,
-                PolicyName=f"{role_name}-policy",
-                PolicyDocument=json.dumps(execution_policy)
-            )
-            
-            print(f"✅ Created execution role: {role_arn}")
-            return role_arn
-            
-        except iam_client.exceptions.EntityAlreadyExistsException:
-            role_response = iam_client.get_role(RoleName=role_name)
-            role_arn = role_response['Role']['Arn']
-            print(f"✅ Using existing execution role: {role_arn}")
-            return role_arn
+        # Create role
+        role_response = iam_client.create_role(
+            RoleName=role_name,
+            AssumeRolePolicyDocument=json.dumps(trust_policy),
+            Description=f"Execution role for {self.agent_name} AgentCore runtime"
+        )
+        role_arn = role_response['Role']['Arn']
+        
+        # Attach policy
+        iam_client.put_role_policy(
+            RoleName=role_name,
+            PolicyName=f"{role_name}-policy",
+            PolicyDocument=json.dumps(execution_policy)
+        )
+        
+        print(f"✅ Created execution role: {role_arn}")
+        self.execution_role_arn = role_arn
+        return role_arn
     
     def deploy_agent_runtime(self):
         """Deploy agent to AgentCore Runtime"""
@@ -217,21 +359,8 @@ CMD ["python", "agentcore_main.py"]
             
             # Wait for deployment to complete
             print("⏳ Waiting for deployment to complete...")
-            while True:
-                status_response = self.agentcore_client.get_agent_runtime(
-                    agentRuntimeArn=agent_runtime_arn
-                )
-                status = status_response['agentRuntimeStatus']
-                print(f"Status: {status}")
-                
-                if status == 'READY':
-                    print("✅ Agent runtime is ready!")
-                    break
-                elif status in ['FAILED', 'STOPPED']:
-                    print(f"❌ Deployment failed with status: {status}")
-                    return None
-                
-                time.sleep(30)
+            if not self._wait_for_ready(agent_runtime_arn):
+                return None
             
             return agent_runtime_arn
             
@@ -239,11 +368,42 @@ CMD ["python", "agentcore_main.py"]
             print(f"❌ Failed to create agent runtime: {e}")
             return None
     
+    def _wait_for_ready(self, agent_runtime_arn: str, max_wait: int = 600,
+                        base_delay: float = 2, max_delay: float = 30) -> bool:
+        """Poll the runtime status with jittered exponential backoff until READY or deadline"""
+        deadline = time.monotonic() + max_wait
+        attempt = 0
+        while True:
+            status_response = self.agentcore_client.get_agent_runtime(
+                agentRuntimeArn=agent_runtime_arn
+            )
+            status = status_response['agentRuntimeStatus']
+            print(f"Status: {status}")
+            
+            if status == 'READY':
+                print("✅ Agent runtime is ready!")
+                return True
+            elif status.endswith('FAILED') or status == 'STOPPED':
+                print(f"❌ Deployment failed with status: {status}")
+                return False
+            
+            delay = min(max_delay, base_delay * 2 ** attempt) + random.uniform(0, 1)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                print(f"❌ Agent runtime not ready after {max_wait}s (last status: {status})")
+                return False
+            time.sleep(min(delay, remaining))
+            attempt += 1
+    
     def test_agent(self, agent_runtime_arn: str):
         """Test the deployed agent"""
         print("🧪 Testing deployed agent...")
         
-        runtime_client = boto3.client('bedrock-agentcore', region_name=self.region)
+        # Agent responses take far longer than control-plane calls, so relax the read timeout
+        runtime_client = self._session.client(
+            'bedrock-agentcore',
+            config=self._config.merge(Config(read_timeout=300))
+        )
         
         test_payload = json.dumps({
             "prompt": "What is AWS Lambda?"
@@ -270,8 +430,19 @@ CMD ["python", "agentcore_main.py"]
         print(f"Region: {self.region}")
         print(f"Account: {self.account_id}")
         
-        # Step 1: Create ECR repository
-        self.create_ecr_repository()
+        # Step 1: Create ECR repository and execution role, and write the Dockerfile, concurrently
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(self.create_ecr_repository),
+                executor.submit(self.create_execution_role),
+                executor.submit(self._prepare_build_context),
+            ]
+            concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+            for future in futures:
+                if future.done() and future.exception():
+                    print(f"❌ Deployment failed during setup: {future.exception()}")
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    return False
         
         # Step 2: Build and push Docker image
         if not self.build_and_push_image():
@@ -302,13 +473,16 @@ def main():
     parser.add_argument("--agent-name", default="aws-assistant-mcp", help="Agent name")
     parser.add_argument("--region", default="us-east-1", help="AWS region")
     parser.add_argument("--execution-role-arn", help="IAM execution role ARN (optional)")
+    parser.add_argument("--session-bucket", default="zk-aws-mcp-assistant-sessions",
+                        help="S3 bucket holding agent sessions")
     
     args = parser.parse_args()
     
     deployer = AgentCoreDeployer(
         agent_name=args.agent_name,
         region=args.region,
-        execution_role_arn=args.execution_role_arn
+        execution_role_arn=args.execution_role_arn,
+        session_bucket=args.session_bucket
     )
     
     success = deployer.deploy()
@@ -7,14 +7,19 @@ and optimization using Strands AI framework and Model Context Protocol (MCP) ser
 """
 
 import os
+import re
 import uuid
+import asyncio
 import logging
+import importlib
+import threading
+from functools import lru_cache
 from pathlib import Path
 
 # Import configuration
 from agent.config import (
-    AWS_REGION, BEDROCK_MODEL_ID, MODEL_TEMPERATURE,
-    S3_SESSION_BUCKET, SERVER_HOST, SERVER_PORT, STRANDS_AUTO_APPROVE_TOOLS
+    AWS_REGION, BEDROCK_MODEL_ID, MODEL_TEMPERATURE, MODEL_CACHE_PROMPT, MODEL_CACHE_TOOLS,
+    S3_SESSION_BUCKET, SERVER_HOST, SERVER_PORT, STRANDS_AUTO_APPROVE_TOOLS, PREWARM_TOOLS
 )
 
 # Import prompts
@@ -26,6 +31,9 @@ from agent.prompts import (
 # Import formatters
 from agent.formatters import AgentFormatter
 
+# Error messages that indicate a dropped or unreachable Bedrock connection
+BEDROCK_CONNECTION_ERROR_PATTERN = re.compile(r"Connection was closed|endpoint URL")
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -34,23 +42,25 @@ logger = logging.getLogger(__name__)
 os.environ["AWS_REGION"] = AWS_REGION
 os.environ["STRANDS_AUTO_APPROVE_TOOLS"] = STRANDS_AUTO_APPROVE_TOOLS
 
-# Import tools
-from tools.aws_cloudwatch_assistant import aws_cloudwatch_assistant
-from tools.aws_cost_assistant import aws_cost_assistant
-from tools.aws_documentation_researcher import aws_documentation_researcher
-from tools.aws_pricing_assistant import aws_pricing_assistant
-from tools.aws_security_assistant import aws_security_assistant
-from tools.aws_support_assistant import aws_support_assistant
-from tools.eks_assistant import eks_assistant
-from tools.eksctl_tool import eksctl_tool
-from tools.graph_creater import graph_creater
+# Tool modules, imported on first use so cold start only pays for the tools an agent needs
+TOOL_MODULES = {
+    "aws_cloudwatch_assistant": "tools.aws_cloudwatch_assistant",
+    "aws_cost_assistant": "tools.aws_cost_assistant",
+    "aws_documentation_researcher": "tools.aws_documentation_researcher",
+    "aws_pricing_assistant": "tools.aws_pricing_assistant",
+    "aws_security_assistant": "tools.aws_security_assistant",
+    "aws_support_assistant": "tools.aws_support_assistant",
+    "eks_assistant": "tools.eks_assistant",
+    "eksctl_tool": "tools.eksctl_tool",
+    "graph_creater": "tools.graph_creater",
+}
 
 # Import Strands framework
 from strands import Agent
-from strands_tools import think, shell, use_aws
+from strands_tools import think, use_aws
 from strands.session import S3SessionManager
 from bedrock_agentcore.runtime import BedrockAgentCoreApp
-from strands.models import BedrockModel
+from strands.models import BedrockModel, CacheConfig
 from botocore.config import Config as BotocoreConfig
 
 # Import Starlette components
@@ -60,20 +70,40 @@ from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
 
 
+@lru_cache(maxsize=None)
+def load_tool(name: str):
+    """Import a tool module on first use and return its tool"""
+    return getattr(importlib.import_module(TOOL_MODULES[name]), name)
+
+
+def prewarm_tools():
+    """Import every tool module ahead of the first request that needs it"""
+    for name in TOOL_MODULES:
+        try:
+            load_tool(name)
+        except Exception as e:
+            logger.warning(f"Failed to pre-load tool {name}: {e}")
+
+
 def create_bedrock_model():
     """Create and configure Bedrock model"""
     boto_config = BotocoreConfig(
         retries={"max_attempts": 5, "mode": "adaptive"},
         connect_timeout=30,
         read_timeout=300,
-        max_pool_connections=50
+        max_pool_connections=50,
+        tcp_keepalive=True
     )
     
     return BedrockModel(
         model_id=BEDROCK_MODEL_ID,
         region_name=AWS_REGION,
         temperature=MODEL_TEMPERATURE,
-        config=boto_config
+        cache_config=CacheConfig(
+            system_prompt_ttl=MODEL_CACHE_PROMPT,
+            tools_ttl=MODEL_CACHE_TOOLS
+        ),
+        boto_client_config=boto_config
     )
 
 
@@ -86,259 +116,124 @@ def create_session_manager(session_id: str):
     )
 
 
+def create_agent(system_prompt: str, tools: list, session_id: str):
+    """Create an agent restored from its S3-backed session"""
+    return Agent(
+        system_prompt=system_prompt,
+        model=bedrock_model,
+        tools=tools,
+        session_manager=create_session_manager(session_id),
+        callback_handler=None,
+    )
+
+
 # Initialize Bedrock model
 bedrock_model = create_bedrock_model()
 
 # Initialize BedrockAgentCoreApp
 app = BedrockAgentCoreApp()
 
-
-# Agent invocation handlers
-async def diagnosis_invocations(request):
-    """Handle DiagnosisAgent invocation requests"""
-    request_data = await request.json()
-    session_id = request_data.get("session_id", str(uuid.uuid4()))
-    
-    async def generate_response():
-        try:
-            formatted_request = AgentFormatter.format_request(
-                request_data.get("prompt", ""), 
-                session_id
-            )
-            
-            logger.info(f"[{session_id[:8]}] Processing diagnosis request")
-            
-            session_manager = create_session_manager(session_id)
-            
-            agent_with_session = Agent(
-                system_prompt=AWS_DIAGNOSIS_AGENT_PROMPT,
-                model=bedrock_model,
-                tools=[think, use_aws],
-                session_manager=session_manager,
-            )
-            
-            async for event in agent_with_session.stream_async(formatted_request["prompt"]):
-                if isinstance(event, dict):
-                    yield AgentFormatter.format_response_chunk(event, session_id)
-                elif hasattr(event, 'model_dump'):
-                    yield AgentFormatter.format_response_chunk(event.model_dump(), session_id)
-                
-        except Exception as e:
-            logger.error(f"[{session_id[:8]}] Error in invocations: {e}")
-            yield AgentFormatter.format_error(e, session_id)
-    
-    response = StreamingResponse(generate_response(), media_type="text/event-stream")
-    response.headers["Access-Control-Allow-Origin"] = "*"
-    response.headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
-    response.headers["Access-Control-Allow-Headers"] = "*"
-    return response
+# Load tools in the background so startup isn't blocked but first requests find them warm
+if PREWARM_TOOLS:
+    threading.Thread(target=prewarm_tools, daemon=True).start()
 
 
-async def research_invocations(request):
-    """Handle ResearchAgent invocation requests"""
-    request_data = await request.json()
-    session_id = request_data.get("session_id", str(uuid.uuid4()))
-    
-    async def generate_response():
-        try:
-            formatted_request = AgentFormatter.format_request(
-                request_data.get("prompt", ""), 
-                session_id
-            )
-            
-            logger.info(f"[{session_id[:8]}] Processing research request")
-            
-            session_manager = create_session_manager(session_id)
-            
-            agent_with_session = Agent(
-                system_prompt=AWS_RESEARCH_AGENT_PROMPT,
-                model=bedrock_model,
-                tools=[aws_documentation_researcher, use_aws],
-                session_manager=session_manager,
-            )
-            
-            async for event in agent_with_session.stream_async(formatted_request["prompt"]):
-                if isinstance(event, dict):
-                    yield AgentFormatter.format_response_chunk(event, session_id)
-                elif hasattr(event, 'model_dump'):
-                    yield AgentFormatter.format_response_chunk(event.model_dump(), session_id)
-                
-        except Exception as e:
-            logger.error(f"[{session_id[:8]}] Error in research invocations: {e}")
-            yield AgentFormatter.format_error(e, session_id)
-    
-    response = StreamingResponse(generate_response(), media_type="text/event-stream")
-    response.headers["Access-Control-Allow-Origin"] = "*"
-    response.headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
-    response.headers["Access-Control-Allow-Headers"] = "*"
-    return response
+def describe_bedrock_error(e: Exception) -> str:
+    """Replace raw Bedrock connection failures with a user-facing message"""
+    error_msg = str(e)
+    if BEDROCK_CONNECTION_ERROR_PATTERN.search(error_msg):
+        error_msg = "Bedrock service connection issue. Please try again in a moment."
+    return error_msg
 
 
-async def support_invocations(request):
-    """Handle AWS Support Case invocations"""
-    request_data = await request.json()
-    session_id = request_data.get("session_id", str(uuid.uuid4()))
+def make_invocation_handler(label: str, system_prompt: str, get_tools, describe_error=None):
+    """Build a streaming invocation handler for one agent
     
-    async def generate_response():
-        try:
-            formatted_request = AgentFormatter.format_request(
-                request_data.get("prompt", ""), 
-                session_id
-            )
-            
-            logger.info(f"[{session_id[:8]}] Processing support request")
-            
-            session_manager = create_session_manager(session_id)
-            
-            agent_with_session = Agent(
-                system_prompt=AWS_SUPPORT_AGENT_PROMPT,
-                model=bedrock_model,
-                tools=[aws_support_assistant, use_aws],
-                session_manager=session_manager,
-            )
-            
-            async for event in agent_with_session.stream_async(formatted_request["prompt"]):
-                if isinstance(event, dict):
-                    yield AgentFormatter.format_response_chunk(event, session_id)
-                elif hasattr(event, 'model_dump'):
-                    yield AgentFormatter.format_response_chunk(event.model_dump(), session_id)
+    get_tools is called per request so lazily loaded tools are resolved on first use.
+    describe_error may rewrite an exception's message for the client.
+    """
+    async def invocations(request):
+        request_data = await request.json()
+        session_id = request_data.get("session_id", str(uuid.uuid4()))
+        
+        async def generate_response():
+            try:
+                prompt = request_data.get("prompt", "")
                 
-        except Exception as e:
-            logger.error(f"[{session_id[:8]}] Error in support invocations: {e}")
-            yield AgentFormatter.format_error(e, session_id)
-    
-    response = StreamingResponse(generate_response(), media_type="text/event-stream")
-    response.headers["Access-Control-Allow-Origin"] = "*"
-    response.headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
-    response.headers["Access-Control-Allow-Headers"] = "*"
-    return response
-
-
-async def pricing_invocations(request):
-    """Handle AWS Pricing invocations"""
-    request_data = await request.json()
-    session_id = request_data.get("session_id", str(uuid.uuid4()))
-    
-    async def generate_response():
-        try:
-            formatted_request = AgentFormatter.format_request(
-                request_data.get("prompt", ""), 
-                session_id
-            )
-            
-            logger.info(f"[{session_id[:8]}] Processing pricing request")
-            
-            session_manager = create_session_manager(session_id)
-            
-            agent_with_session = Agent(
-                system_prompt=AWS_PRICING_AGENT_PROMPT,
-                model=bedrock_model,
-                tools=[aws_pricing_assistant, use_aws],
-                session_manager=session_manager,
-            )
-            
-            async for event in agent_with_session.stream_async(formatted_request["prompt"]):
-                if isinstance(event, dict):
-                    yield AgentFormatter.format_response_chunk(event, session_id)
-                elif hasattr(event, 'model_dump'):
-                    yield AgentFormatter.format_response_chunk(event.model_dump(), session_id)
+                # Skip the model round-trip for prompts it would reject anyway
+                if not prompt.strip():
+                    yield AgentFormatter.format_error(ValueError("Prompt must not be empty"), session_id)
+                    return
                 
-        except Exception as e:
-            logger.error(f"[{session_id[:8]}] Error in pricing invocations: {e}")
-            yield AgentFormatter.format_error(e, session_id)
-    
-    response = StreamingResponse(generate_response(), media_type="text/event-stream")
-    response.headers["Access-Control-Allow-Origin"] = "*"
-    response.headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
-    response.headers["Access-Control-Allow-Headers"] = "*"
-    return response
-
-
-async def cost_billing_invocations(request):
-    """Handle AWS Cost and Billing invocations"""
-    request_data = await request.json()
-    session_id = request_data.get("session_id", str(uuid.uuid4()))
-    
-    async def generate_response():
-        try:
-            formatted_request = AgentFormatter.format_request(
-                request_data.get("prompt", ""), 
-                session_id
-            )
-            
-            logger.info(f"[{session_id[:8]}] Processing cost/billing request")
-            
-            session_manager = create_session_manager(session_id)
-            
-            agent_with_session = Agent(
-                system_prompt=AWS_COST_BILLING_AGENT_PROMPT,
-                model=bedrock_model,
-                tools=[aws_cost_assistant, use_aws],
-                session_manager=session_manager,
-            )
-            
-            async for event in agent_with_session.stream_async(formatted_request["prompt"]):
-                if isinstance(event, dict):
-                    yield AgentFormatter.format_response_chunk(event, session_id)
-                elif hasattr(event, 'model_dump'):
-                    yield AgentFormatter.format_response_chunk(event.model_dump(), session_id)
+                logger.info(f"[{session_id[:8]}] Processing {label} request")
                 
-        except Exception as e:
-            logger.error(f"[{session_id[:8]}] Error in cost/billing invocations: {e}")
-            yield AgentFormatter.format_error(e, session_id)
+                # Tool imports and session setup (S3 reads and writes) both block, so keep them off the event loop
+                agent_with_session = await asyncio.to_thread(
+                    lambda: create_agent(system_prompt, get_tools(), session_id)
+                )
+                
+                async for event in agent_with_session.stream_async(prompt):
+                    if isinstance(event, dict):
+                        yield AgentFormatter.format_response_chunk(event, session_id)
+                    elif hasattr(event, 'model_dump'):
+                        yield AgentFormatter.format_response_chunk(event.model_dump(), session_id)
+                    
+            except Exception as e:
+                logger.error(f"[{session_id[:8]}] Error in {label} invocations: {e}")
+                error = e
+                if describe_error is not None:
+                    error_msg = describe_error(e)
+                    if error_msg != str(e):
+                        error = Exception(error_msg)
+                yield AgentFormatter.format_error(error, session_id)
+        
+        response = StreamingResponse(generate_response(), media_type="text/event-stream")
+        response.headers["Access-Control-Allow-Origin"] = "*"
+        response.headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
+        response.headers["Access-Control-Allow-Headers"] = "*"
+        return response
     
-    response = StreamingResponse(generate_response(), media_type="text/event-stream")
-    response.headers["Access-Control-Allow-Origin"] = "*"
-    response.headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
-    response.headers["Access-Control-Allow-Headers"] = "*"
-    return response
+    return invocations
 
 
-async def general_invocations(request):
-    """Handle General AWS Assistant invocations"""
-    request_data = await request.json()
-    session_id = request_data.get("session_id", str(uuid.uuid4()))
-    
-    async def generate_response():
-        try:
-            formatted_request = AgentFormatter.format_request(
-                request_data.get("prompt", ""), 
-                session_id
-            )
-            
-            logger.info(f"[{session_id[:8]}] Processing general AWS request")
-            
-            session_manager = create_session_manager(session_id)
-            
-            agent_with_session = Agent(
-                system_prompt=AWS_GENERAL_AGENT_PROMPT,
-                model=bedrock_model,
-                tools=[
-                    think, use_aws, aws_documentation_researcher, aws_cost_assistant, 
-                    aws_pricing_assistant, aws_support_assistant, aws_security_assistant, 
-                    aws_cloudwatch_assistant, eks_assistant, eksctl_tool, graph_creater
-                ],
-                session_manager=session_manager,
-            )
-            
-            async for event in agent_with_session.stream_async(formatted_request["prompt"]):
-                if isinstance(event, dict):
-                    yield AgentFormatter.format_response_chunk(event, session_id)
-                elif hasattr(event, 'model_dump'):
-                    yield AgentFormatter.format_response_chunk(event.model_dump(), session_id)
-                
-        except Exception as e:
-            error_msg = str(e)
-            if "Connection was closed" in error_msg or "endpoint URL" in error_msg:
-                error_msg = "Bedrock service connection issue. Please try again in a moment."
-            logger.error(f"[{session_id[:8]}] Error in general invocations: {e}")
-            yield AgentFormatter.format_error(Exception(error_msg), session_id)
-    
-    response = StreamingResponse(generate_response(), media_type="text/event-stream")
-    response.headers["Access-Control-Allow-Origin"] = "*"
-    response.headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
-    response.headers["Access-Control-Allow-Headers"] = "*"
-    return response
+# Agent invocation handlers
+diagnosis_invocations = make_invocation_handler(
+    "diagnosis",
+    AWS_DIAGNOSIS_AGENT_PROMPT,
+    lambda: [think, use_aws]
+)
+research_invocations = make_invocation_handler(
+    "research",
+    AWS_RESEARCH_AGENT_PROMPT,
+    lambda: [load_tool("aws_documentation_researcher"), use_aws]
+)
+support_invocations = make_invocation_handler(
+    "support",
+    AWS_SUPPORT_AGENT_PROMPT,
+    lambda: [load_tool("aws_support_assistant"), use_aws]
+)
+pricing_invocations = make_invocation_handler(
+    "pricing",
+    AWS_PRICING_AGENT_PROMPT,
+    lambda: [load_tool("aws_pricing_assistant"), use_aws]
+)
+cost_billing_invocations = make_invocation_handler(
+    "cost/billing",
+    AWS_COST_BILLING_AGENT_PROMPT,
+    lambda: [load_tool("aws_cost_assistant"), use_aws]
+)
+general_invocations = make_invocation_handler(
+    "general AWS",
+    AWS_GENERAL_AGENT_PROMPT,
+    lambda: [think, use_aws] + [
+        load_tool(name) for name in (
+            "aws_documentation_researcher", "aws_cost_assistant", "aws_pricing_assistant",
+            "aws_support_assistant", "aws_security_assistant", "aws_cloudwatch_assistant",
+            "eks_assistant", "eksctl_tool", "graph_creater"
+        )
+    ],
+    describe_error=describe_bedrock_error
+)
 
 
 async def options_handler(request):
@@ -375,10 +270,10 @@ app.router.routes.append(Route("/GeneralAgent/invocations", general_invocations,
 app.router.routes.append(Route("/GeneralAgent/invocations", options_handler, methods=["OPTIONS"]))
 app.router.routes.append(Route("/health", health_check, methods=["GET"]))
 
-# Debug: Print all registered routes
-print("Registered routes:")
-for route in app.router.routes:
-    print(f"  {route.path} - {route.methods}")
+# Debug: Log all registered routes
+if logger.isEnabledFor(logging.DEBUG):
+    for route in app.router.routes:
+        logger.debug("Registered route: %s - %s", route.path, route.methods)
 
 
 # Interactive mode when run directly
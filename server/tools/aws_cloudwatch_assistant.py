@@ -1,6 +1,7 @@
-from mcp import StdioServerParameters, stdio_client
 from strands import Agent, tool
-from strands.tools.mcp import MCPClient
+from tools.cache import tool_result_cache
+from tools.mcp_clients import mcp_tools
+from tools.models import get_bedrock_model
 
 
 @tool
@@ -26,22 +27,17 @@ def aws_cloudwatch_assistant(query: str) -> str:
     """
 
     formatted_query = f"Analyze and respond to this Amazon CloudWatch question, providing clear explanations, metrics analysis, and actionable monitoring guidance: {query}"
+    cached_response = tool_result_cache.get("aws_cloudwatch_assistant", query)
+    if cached_response is not None:
+        return cached_response
+
     response = str()
 
     try:
-        cloudwatch_mcp_server = MCPClient(
-            lambda: stdio_client(
-                StdioServerParameters(
-                    command="uvx", args=["awslabs.cloudwatch-mcp-server@latest"]
-                )
-            )
-        )
-
-        with cloudwatch_mcp_server:
-
-            tools = cloudwatch_mcp_server.list_tools_sync()
+        with mcp_tools("awslabs.cloudwatch-mcp-server") as tools:
             # Create the CloudWatch agent with specific capabilities
             cloudwatch_agent = Agent(
+                model=get_bedrock_model(),
                 system_prompt="""You are an Amazon CloudWatch specialist with access to the CloudWatch MCP server tools. Your role is to:
                 
                 1. Analyze CloudWatch-related questions and determine the best CloudWatch tools to use
@@ -93,11 +89,12 @@ def aws_cloudwatch_assistant(query: str) -> str:
                 Provide your complete response directly - do not create any files.
                 """,
                 tools=tools,
+                callback_handler=None,
             )
             response = str(cloudwatch_agent(formatted_query))
-            print("\n\n")
 
         if len(response) > 0:
+            tool_result_cache.put("aws_cloudwatch_assistant", query, response)
             return response
 
         return "I apologize, but I couldn't access CloudWatch information for your query using the CloudWatch MCP server. This might be due to insufficient CloudWatch permissions, connectivity issues, or the specific metrics/logs being unavailable. Please verify your CloudWatch permissions and try again."
@@ -119,4 +116,4 @@ def aws_cloudwatch_assistant(query: str) -> str:
 
 
 if __name__ == "__main__":
-    aws_cloudwatch_assistant("Show me CPU utilization for my EC2 instances")
+    print(aws_cloudwatch_assistant("Show me CPU utilization for my EC2 instances"))
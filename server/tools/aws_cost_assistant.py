@@ -1,9 +1,12 @@
 import os
 
-from mcp import StdioServerParameters, stdio_client
 from strands import Agent, tool
-from strands.models import BedrockModel
-from strands.tools.mcp import MCPClient
+from tools.cache import tool_result_cache
+from tools.mcp_clients import mcp_tools
+from tools.models import get_bedrock_model
+
+COST_AGENT_MODEL_ID = "us.anthropic.claude-3-5-haiku-20241022-v1:0"
+
 
 @tool
 def aws_cost_assistant(query: str) -> str:
@@ -17,7 +20,9 @@ def aws_cost_assistant(query: str) -> str:
         A helpful response addressing user query
     """
 
-    bedrock_model = BedrockModel(model_id="us.anthropic.claude-3-5-haiku-20241022-v1:0")
+    cached_response = tool_result_cache.get("aws_cost_assistant", query)
+    if cached_response is not None:
+        return cached_response
 
     response = str()
 
@@ -25,22 +30,10 @@ def aws_cost_assistant(query: str) -> str:
         env = {}
         if os.getenv("BEDROCK_LOG_GROUP_NAME") is not None:
             env["BEDROCK_LOG_GROUP_NAME"] = os.getenv("BEDROCK_LOG_GROUP_NAME")
-        cost_mcp_server = MCPClient(
-            lambda: stdio_client(
-                StdioServerParameters(
-                    command="uvx",
-                    args=["awslabs.cost-explorer-mcp-server@latest"],
-                    env=env,
-                )
-            )
-        )
-
-        with cost_mcp_server:
-
-            tools = cost_mcp_server.list_tools_sync()
+        with mcp_tools("awslabs.cost-explorer-mcp-server", env=env) as tools:
             # Create the research agent with specific capabilities
             cost_agent = Agent(
-                model=bedrock_model,
+                model=get_bedrock_model(COST_AGENT_MODEL_ID),
                 system_prompt="""You are a AWS account cost analyst. You can do the following tasks:
                 - Amazon EC2 Spend Analysis: View detailed breakdowns of EC2 spending for the last day
                 - Amazon Bedrock Spend Analysis: View breakdown by region, users and models over the last 30 days
@@ -51,11 +44,12 @@ def aws_cost_assistant(query: str) -> str:
                 Provide all analysis and results directly in your response - do not create any files.
                 """,
                 tools=tools,
+                callback_handler=None,
             )
             response = str(cost_agent(query))
-            print("\n\n")
 
         if len(response) > 0:
+            tool_result_cache.put("aws_cost_assistant", query, response)
             return response
 
         return "I apologize, but I couldn't properly analyze your question. Could you please rephrase or provide more context?"
@@ -65,4 +59,4 @@ def aws_cost_assistant(query: str) -> str:
 
 
 if __name__ == "__main__":
-    aws_cost_assistant("Get my usage of last 7 days per service")
+    print(aws_cost_assistant("Get my usage of last 7 days per service"))
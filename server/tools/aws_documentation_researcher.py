@@ -1,6 +1,7 @@
-from mcp import StdioServerParameters, stdio_client
 from strands import Agent, tool
-from strands.tools.mcp import MCPClient
+from tools.cache import tool_result_cache
+from tools.mcp_clients import mcp_tools
+from tools.models import get_bedrock_model
 
 
 @tool
@@ -16,23 +17,18 @@ def aws_documentation_researcher(query: str) -> str:
     """
 
     formatted_query = f"Research and provide a detailed answer to this AWS question: {query}"
+    cached_response = tool_result_cache.get("aws_documentation_researcher", query)
+    if cached_response is not None:
+        return cached_response
+
     response = str()
 
     try:
         # Use the working AWS documentation MCP server
-        documentation_mcp_server = MCPClient(
-            lambda: stdio_client(
-                StdioServerParameters(
-                    command="uvx", args=["awslabs.aws-documentation-mcp-server@latest"]
-                )
-            )
-        )
-
-        with documentation_mcp_server:
-            tools = documentation_mcp_server.list_tools_sync()
-            
+        with mcp_tools("awslabs.aws-documentation-mcp-server") as tools:
             # Create the research agent with AWS documentation capabilities
             research_agent = Agent(
+                model=get_bedrock_model(),
                 system_prompt="""You are an AWS expert researcher with access to comprehensive AWS documentation.
                 
                 Your approach:
@@ -46,10 +42,12 @@ def aws_documentation_researcher(query: str) -> str:
                 Always structure your response clearly with headings, examples, and step-by-step guidance where appropriate.
                 """,
                 tools=tools,
+                callback_handler=None,
             )
             response = str(research_agent(formatted_query))
 
         if len(response) > 0:
+            tool_result_cache.put("aws_documentation_researcher", query, response)
             return response
 
         return "I apologize, but I couldn't find relevant AWS documentation for your question. Could you please rephrase or provide more specific details?"
@@ -59,4 +57,4 @@ def aws_documentation_researcher(query: str) -> str:
 
 
 if __name__ == "__main__":
-    aws_documentation_researcher("What is Amazon EKS and how do I get started?")
+    print(aws_documentation_researcher("What is Amazon EKS and how do I get started?"))
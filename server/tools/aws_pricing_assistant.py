@@ -1,6 +1,7 @@
-from mcp import StdioServerParameters, stdio_client
 from strands import Agent, tool
-from strands.tools.mcp import MCPClient
+from tools.cache import tool_result_cache
+from tools.mcp_clients import mcp_tools
+from tools.models import get_bedrock_model
 
 
 @tool
@@ -26,22 +27,17 @@ def aws_pricing_assistant(query: str) -> str:
     """
 
     formatted_query = f"Analyze and respond to this AWS pricing question, providing clear explanations, cost breakdowns, and actionable pricing guidance: {query}"
+    cached_response = tool_result_cache.get("aws_pricing_assistant", query)
+    if cached_response is not None:
+        return cached_response
+
     response = str()
 
     try:
-        pricing_mcp_server = MCPClient(
-            lambda: stdio_client(
-                StdioServerParameters(
-                    command="uvx", args=["awslabs.aws-pricing-mcp-server@latest"]
-                )
-            )
-        )
-
-        with pricing_mcp_server:
-
-            tools = pricing_mcp_server.list_tools_sync()
+        with mcp_tools("awslabs.aws-pricing-mcp-server") as tools:
             # Create the pricing agent with specific capabilities
             pricing_agent = Agent(
+                model=get_bedrock_model(),
                 system_prompt="""You are an AWS Pricing specialist with access to the AWS Pricing MCP server tools. Your role is to:
                 
                 1. Analyze AWS pricing-related questions and determine the best pricing tools to use
@@ -85,11 +81,12 @@ def aws_pricing_assistant(query: str) -> str:
                 Provide your complete response directly - do not create any files.
                 """,
                 tools=tools,
+                callback_handler=None,
             )
             response = str(pricing_agent(formatted_query))
-            print("\n\n")
 
         if len(response) > 0:
+            tool_result_cache.put("aws_pricing_assistant", query, response)
             return response
 
         return "I apologize, but I couldn't access AWS pricing information for your query using the AWS Pricing MCP server. This might be due to connectivity issues with the pricing service or the specific pricing data being unavailable. Please try rephrasing your question or check if the AWS Pricing API is accessible."
@@ -109,4 +106,4 @@ def aws_pricing_assistant(query: str) -> str:
 
 
 if __name__ == "__main__":
-    aws_pricing_assistant("What's the cost of running a t3.medium EC2 instance in us-east-1?")
+    print(aws_pricing_assistant("What's the cost of running a t3.medium EC2 instance in us-east-1?"))
@@ -1,6 +1,7 @@
-from mcp import StdioServerParameters, stdio_client
 from strands import Agent, tool
-from strands.tools.mcp import MCPClient
+from tools.cache import tool_result_cache
+from tools.mcp_clients import mcp_tools
+from tools.models import get_bedrock_model
 
 
 @tool
@@ -27,22 +28,17 @@ def aws_security_assistant(query: str) -> str:
     """
 
     formatted_query = f"Analyze and respond to this AWS security question, providing clear security assessments, best practices recommendations, and actionable security guidance based on AWS Well-Architected Framework: {query}"
+    cached_response = tool_result_cache.get("aws_security_assistant", query)
+    if cached_response is not None:
+        return cached_response
+
     response = str()
 
     try:
-        security_mcp_server = MCPClient(
-            lambda: stdio_client(
-                StdioServerParameters(
-                    command="uvx", args=["awslabs.well-architected-security-mcp-server@latest"]
-                )
-            )
-        )
-
-        with security_mcp_server:
-
-            tools = security_mcp_server.list_tools_sync()
+        with mcp_tools("awslabs.well-architected-security-mcp-server") as tools:
             # Create the security assessment agent with specific capabilities
             security_agent = Agent(
+                model=get_bedrock_model(),
                 system_prompt="""You are an AWS Security Assessment specialist with access to the Well-Architected Security MCP server tools. Your role is to:
                 
                 1. Analyze AWS security-related questions and determine the best security assessment tools to use
@@ -107,11 +103,12 @@ def aws_security_assistant(query: str) -> str:
                 Provide your complete response directly - do not create any files.
                 """,
                 tools=tools,
+                callback_handler=None,
             )
             response = str(security_agent(formatted_query))
-            print("\n\n")
 
         if len(response) > 0:
+            tool_result_cache.put("aws_security_assistant", query, response)
             return response
 
         return "I apologize, but I couldn't access AWS security assessment information for your query using the Well-Architected Security MCP server. This might be due to insufficient permissions for security analysis, connectivity issues, or the specific security resources being unavailable. Please verify your AWS permissions for security services and try again."
@@ -133,4 +130,4 @@ def aws_security_assistant(query: str) -> str:
 
 
 if __name__ == "__main__":
-    aws_security_assistant("Assess the security posture of my AWS account")
+    print(aws_security_assistant("Assess the security posture of my AWS account"))
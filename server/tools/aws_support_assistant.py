@@ -1,6 +1,6 @@
-from mcp import StdioServerParameters, stdio_client
 from strands import Agent, tool
-from strands.tools.mcp import MCPClient
+from tools.mcp_clients import mcp_tools
+from tools.models import get_bedrock_model
 
 
 @tool
@@ -26,19 +26,10 @@ def aws_support_assistant(query: str) -> str:
     response = str()
 
     try:
-        support_mcp_server = MCPClient(
-            lambda: stdio_client(
-                StdioServerParameters(
-                    command="uvx", args=["awslabs.aws-support-mcp-server@latest"]
-                )
-            )
-        )
-
-        with support_mcp_server:
-
-            tools = support_mcp_server.list_tools_sync()
+        with mcp_tools("awslabs.aws-support-mcp-server") as tools:
             # Create the support agent with specific capabilities
             support_agent = Agent(
+                model=get_bedrock_model(),
                 system_prompt="""You are an AWS Support specialist with access to AWS Support tools. Your role is to:
                 
                 1. Analyze AWS Support related questions and determine the best approach
@@ -58,9 +49,9 @@ def aws_support_assistant(query: str) -> str:
                 Provide your complete response directly - do not create any files.
                 """,
                 tools=tools,
+                callback_handler=None,
             )
             response = str(support_agent(formatted_query))
-            print("\n\n")
 
         if len(response) > 0:
             return response
@@ -112,4 +103,4 @@ Would you like me to help you with account/billing questions or service limit in
 
 
 if __name__ == "__main__":
-    aws_support_assistant("What are my current AWS support cases?")
+    print(aws_support_assistant("What are my current AWS support cases?"))
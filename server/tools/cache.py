@@ -0,0 +1,58 @@
+# Optional TTL cache for read-only tool results
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+# Disabled by default: cached answers can lag behind live AWS state by up to the TTL
+TOOL_CACHE_ENABLED = os.getenv("TOOL_CACHE_ENABLED", "false").lower() == "true"
+TOOL_CACHE_TTL = float(os.getenv("TOOL_CACHE_TTL", "60"))
+TOOL_CACHE_MAXSIZE = 512
+
+
+class ToolResultCache:
+    """LRU cache of tool responses keyed by tool name and normalized query"""
+    
+    def __init__(self, enabled: bool, ttl: float, maxsize: int):
+        self.enabled = enabled
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(tool_name: str, query: str) -> tuple:
+        # Only whitespace is normalized: log groups, cluster names and the like are case-sensitive
+        return tool_name, " ".join(query.split())
+    
+    def get(self, tool_name: str, query: str) -> Optional[str]:
+        """Return a cached response if one was stored within the TTL"""
+        if not self.enabled:
+            return None
+        key = self._key(tool_name, query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, response = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+    
+    def put(self, tool_name: str, query: str, response: str):
+        """Store a successful response, evicting the least recently used entry when full"""
+        if not self.enabled:
+            return
+        key = self._key(tool_name, query)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+tool_result_cache = ToolResultCache(TOOL_CACHE_ENABLED, TOOL_CACHE_TTL, TOOL_CACHE_MAXSIZE)
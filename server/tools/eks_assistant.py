@@ -1,6 +1,7 @@
-from mcp import StdioServerParameters, stdio_client
 from strands import Agent, tool
-from strands.tools.mcp import MCPClient
+from tools.cache import tool_result_cache
+from tools.mcp_clients import mcp_tools
+from tools.models import get_bedrock_model
 
 
 @tool
@@ -25,22 +26,17 @@ def eks_assistant(query: str) -> str:
     """
 
     formatted_query = f"Analyze and respond to this Amazon EKS question, providing clear explanations and actionable guidance. Use the available EKS MCP server tools to gather comprehensive information: {query}"
+    cached_response = tool_result_cache.get("eks_assistant", query)
+    if cached_response is not None:
+        return cached_response
+
     response = str()
 
     try:
-        eks_mcp_server = MCPClient(
-            lambda: stdio_client(
-                StdioServerParameters(
-                    command="uvx", args=["awslabs.eks-mcp-server@latest"]
-                )
-            )
-        )
-
-        with eks_mcp_server:
-
-            tools = eks_mcp_server.list_tools_sync()
+        with mcp_tools("awslabs.eks-mcp-server") as tools:
             # Create the EKS agent with specific capabilities
             eks_agent = Agent(
+                model=get_bedrock_model(),
                 system_prompt="""You are an Amazon EKS (Elastic Kubernetes Service) specialist with access to the EKS MCP server tools. Your role is to:
                 
                 1. Analyze EKS-related questions and determine the best EKS MCP server tools to use
@@ -75,11 +71,12 @@ def eks_assistant(query: str) -> str:
                 Provide your complete response directly - do not create any files.
                 """,
                 tools=tools,
+                callback_handler=None,
             )
             response = str(eks_agent(formatted_query))
-            print("\n\n")
 
         if len(response) > 0:
+            tool_result_cache.put("eks_assistant", query, response)
             return response
 
         return "I apologize, but I couldn't access EKS information for your query using the EKS MCP server. This might be due to insufficient permissions, connectivity issues with the EKS MCP server, or the EKS service being unavailable in your region. Please verify your EKS permissions and try again."
@@ -97,4 +94,4 @@ def eks_assistant(query: str) -> str:
 
 
 if __name__ == "__main__":
-    eks_assistant("How many EKS clusters do I have?")
+    print(eks_assistant("How many EKS clusters do I have?"))
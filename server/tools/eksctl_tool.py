@@ -2,6 +2,10 @@ import subprocess
 import json
 from strands import tool
 
+# Read-only eksctl subcommands that are allowed to run
+READ_ONLY_COMMANDS = ('get', 'describe', 'list', 'version', 'help')
+READ_ONLY_COMMAND_SET = frozenset(READ_ONLY_COMMANDS)
+
 
 @tool
 def eksctl_tool(command: str) -> str:
@@ -22,15 +26,14 @@ def eksctl_tool(command: str) -> str:
     """
     
     # Safety check - only allow read-only operations
-    read_only_commands = ['get', 'describe', 'list', 'version', 'help']
     command_parts = command.strip().split()
     
     if not command_parts:
         return "Error: No command provided. Use commands like 'get clusters' or 'get nodegroups --cluster cluster-name'"
     
     first_command = command_parts[0].lower()
-    if first_command not in read_only_commands:
-        return f"Error: Command '{first_command}' is not allowed. Only read-only operations are permitted: {', '.join(read_only_commands)}"
+    if first_command not in READ_ONLY_COMMAND_SET:
+        return f"Error: Command '{first_command}' is not allowed. Only read-only operations are permitted: {', '.join(READ_ONLY_COMMANDS)}"
     
     # Construct the full eksctl command
     full_command = ['eksctl'] + command_parts
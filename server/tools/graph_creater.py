@@ -1,5 +1,6 @@
 from strands import Agent, tool
 from strands_tools import python_repl, shell
+from tools.models import get_bedrock_model
 
 
 @tool
@@ -20,13 +21,14 @@ def graph_creater(query: str) -> str:
 
         # Create the research agent with specific capabilities
         graph_creater = Agent(
+            model=get_bedrock_model(),
             system_prompt="""
             You are a graph creater agent. Your task is to write python code using Plotly to create graphs and execute this code in provided code environment. You MUST create a single graph, and then stop. You MUST NOT create more than one graph.
             """,
             tools=[python_repl, shell],
+            callback_handler=None,
         )
         response = str(graph_creater(query))
-        print("\n\n")
 
         if len(response) > 0:
             return response
@@ -39,7 +41,7 @@ def graph_creater(query: str) -> str:
 
 
 if __name__ == "__main__":
-    graph_creater(
+    print(graph_creater(
         """Create a bar graph of detailed breakdown of pricing per serice: Based on the detailed breakdown, here's a summary of your AWS service usage over the last 7 days:
 
 Top Services by Total Cost:
@@ -59,4 +61,4 @@ Notable Observations:
 - AWS Lambda is a significant ongoing expense at about $31.82 per day
 - OpenSearch Service has widespread usage across multiple regions
 - SageMaker instance types are primarily t3.medium and t3.large for notebook and hosting"""
-    )
+    ))
@@ -0,0 +1,79 @@
+# Shared MCP server clients for AWS tools
+
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+from mcp import StdioServerParameters, stdio_client
+from strands.tools.mcp import MCPClient
+
+# package -> (started MCPClient, its tools)
+_servers = {}
+_server_locks = {}
+_server_locks_guard = threading.Lock()
+
+
+def _start_server(package: str, env: Optional[dict]):
+    """Launch an MCP server through uvx and list its tools"""
+    client = MCPClient(
+        lambda: stdio_client(
+            StdioServerParameters(
+                command="uvx", args=[f"{package}@latest"], env=env
+            )
+        )
+    )
+    client.start()
+    try:
+        return client, client.list_tools_sync()
+    except Exception:
+        _stop_quietly(client)
+        raise
+
+
+def _is_running(client: MCPClient) -> bool:
+    """Whether the client's MCP session is still up (its background thread exits with the server)"""
+    is_session_active = getattr(client, "_is_session_active", None)
+    if is_session_active is not None:
+        return is_session_active()
+    thread = getattr(client, "_background_thread", None)
+    return thread is not None and thread.is_alive()
+
+
+def _stop_quietly(client: MCPClient):
+    """Stop a client whose server may already be gone"""
+    try:
+        client.stop(None, None, None)
+    except Exception:
+        pass
+
+
+@contextmanager
+def mcp_tools(package: str, env: Optional[dict] = None):
+    """
+    Yield the tools of a shared MCP server, starting it on first use.
+
+    Spawning a uvx subprocess and completing the MCP handshake takes seconds, so
+    each server is started once per process and reused across tool calls. A
+    server whose session has ended is restarted before it is handed out again.
+
+    Args:
+        package: The uvx package that provides the MCP server
+        env: Extra environment variables for the server process
+
+    Yields:
+        The list of tools exposed by the MCP server
+    """
+    with _server_locks_guard:
+        server_lock = _server_locks.setdefault(package, threading.Lock())
+
+    # Start each server under its own lock so a slow launch doesn't block other tools
+    with server_lock:
+        server = _servers.get(package)
+        if server is not None and not _is_running(server[0]):
+            del _servers[package]
+            _stop_quietly(server[0])
+            server = None
+        if server is None:
+            server = _servers[package] = _start_server(package, env)
+
+    yield server[1]
@@ -0,0 +1,34 @@
+# Shared Bedrock models for tool sub-agents
+
+from functools import lru_cache
+from typing import Optional
+
+from botocore.config import Config as BotocoreConfig
+from strands.models import BedrockModel
+
+# Pooled, kept-alive connections shared by concurrent sub-agents
+BOTO_CONFIG = BotocoreConfig(
+    retries={"max_attempts": 5, "mode": "adaptive"},
+    max_pool_connections=50,
+    tcp_keepalive=True
+)
+
+
+@lru_cache(maxsize=None)
+def get_bedrock_model(model_id: Optional[str] = None) -> BedrockModel:
+    """
+    Return a shared BedrockModel, creating it on first use.
+
+    Sub-agents are rebuilt on every tool call. Without an explicit model, each
+    one would create its own Bedrock client, so the model and its connection
+    pool are shared instead.
+
+    Args:
+        model_id: Bedrock model ID, or None for the Strands default model
+
+    Returns:
+        The shared BedrockModel for the given model ID
+    """
+    if model_id is None:
+        return BedrockModel(boto_client_config=BOTO_CONFIG)
+    return BedrockModel(model_id=model_id, boto_client_config=BOTO_CONFIG)
@@ -1,10 +1,14 @@
 from flask import Flask, render_template, request, jsonify, Response
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import boto3
+from botocore.config import Config
 import uuid
 from datetime import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 app = Flask(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -14,9 +18,32 @@ logger = logging.getLogger(__name__)
 AGENTCORE_URL = "http://localhost:8080"
 S3_BUCKET = "zk-aws-mcp-assistant-sessions"
 AWS_REGION = "us-east-1"
+SESSION_FETCH_WORKERS = 10
 
 # Initialize S3 client
-s3_client = boto3.client('s3', region_name=AWS_REGION)
+s3_client = boto3.client(
+    's3',
+    region_name=AWS_REGION,
+    config=Config(
+        retries={'max_attempts': 5, 'mode': 'adaptive'},
+        max_pool_connections=SESSION_FETCH_WORKERS
+    )
+)
+
+# Shared HTTP session so connections to AgentCore are kept alive and reused
+http_session = requests.Session()
+http_session.headers.update({'Content-Type': 'application/json'})
+agentcore_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    # Only retry failed connects; invocations are not safe to replay
+    max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.3)
+)
+http_session.mount('http://', agentcore_adapter)
+http_session.mount('https://', agentcore_adapter)
+
+# Session titles keyed by S3 key, stored with the ETag they were read at
+session_summary_cache = {}
 
 @app.route('/')
 def index():
@@ -26,31 +53,53 @@ def index():
 def get_sessions():
     """Get all chat sessions from S3"""
     try:
-        response = s3_client.list_objects_v2(Bucket=S3_BUCKET, Prefix='sessions/')
-        sessions = []
+        # Page through the listing; a single ListObjectsV2 call stops at 1000 keys
+        paginator = s3_client.get_paginator('list_objects_v2')
+        objects = [
+            obj
+            for page in paginator.paginate(Bucket=S3_BUCKET, Prefix='sessions/')
+            for obj in page.get('Contents', [])
+            if obj['Key'].endswith('.json')
+        ]
         
-        if 'Contents' in response:
-            for obj in response['Contents']:
-                if obj['Key'].endswith('.json'):
-                    session_id = obj['Key'].split('/')[-1].replace('.json', '')
-                    # Get session metadata
-                    try:
-                        session_obj = s3_client.get_object(Bucket=S3_BUCKET, Key=obj['Key'])
-                        session_data = json.loads(session_obj['Body'].read())
-                        title = session_data.get('title', 'Untitled Session')
-                        sessions.append({
-                            'id': session_id,
-                            'title': title,
-                            'last_modified': obj['LastModified'].isoformat()
-                        })
-                    except Exception as e:
-                        logger.error(f"Error reading session {session_id}: {e}")
+        # Forget sessions that no longer exist in the bucket
+        live_keys = {obj['Key'] for obj in objects}
+        for key in list(session_summary_cache):
+            if key not in live_keys:
+                session_summary_cache.pop(key, None)
         
+        # Fetch session metadata concurrently instead of one GetObject round-trip at a time
+        with ThreadPoolExecutor(max_workers=SESSION_FETCH_WORKERS) as executor:
+            results = executor.map(_read_session_summary, objects)
+        
+        sessions = [session for session in results if session is not None]
         return jsonify(sessions)
     except Exception as e:
         logger.error(f"Error listing sessions: {e}")
         return jsonify([])
 
+def _read_session_summary(obj):
+    """Read the title of a single session object, reusing the cached title if unchanged"""
+    session_id = obj['Key'].split('/')[-1].replace('.json', '')
+    cached = session_summary_cache.get(obj['Key'])
+    try:
+        if cached and cached[0] == obj.get('ETag'):
+            title = cached[1]
+        else:
+            session_obj = s3_client.get_object(Bucket=S3_BUCKET, Key=obj['Key'])
+            session_data = json.loads(session_obj['Body'].read())
+            title = session_data.get('title', 'Untitled Session')
+            session_summary_cache[obj['Key']] = (obj.get('ETag'), title)
+        # Rewrites with identical content keep the ETag but not the timestamp, so take it from the listing
+        return {
+            'id': session_id,
+            'title': title,
+            'last_modified': obj['LastModified'].isoformat()
+        }
+    except Exception as e:
+        logger.error(f"Error reading session {session_id}: {e}")
+        return None
+
 @app.route('/api/sessions/<session_id>', methods=['GET'])
 def get_session(session_id):
     """Get specific session details"""
@@ -69,6 +118,7 @@ def delete_session(session_id):
     try:
         key = f'sessions/{session_id}.json'
         s3_client.delete_object(Bucket=S3_BUCKET, Key=key)
+        session_summary_cache.pop(key, None)
         return jsonify({'success': True})
     except Exception as e:
         logger.error(f"Error deleting session {session_id}: {e}")
@@ -92,25 +142,20 @@ def chat():
                 'session_id': session_id
             }
             
-            # Stream response from AgentCore
-            response = requests.post(
-                endpoint,
-                json=payload,
-                stream=True,
-                headers={'Content-Type': 'application/json'}
-            )
-            
-            if response.status_code == 200:
-                for line in response.iter_lines():
-                    if line:
-                        yield f"data: {line.decode('utf-8')}\n\n"
-            else:
-                error_data = {
-                    'type': 'error',
-                    'content': f'Agent request failed: {response.status_code}',
-                    'session_id': session_id
-                }
-                yield f"data: {json.dumps(error_data)}\n\n"
+            # Stream response from AgentCore; closing the response returns the connection to the pool
+            with http_session.post(endpoint, json=payload, stream=True) as response:
+                if response.status_code == 200:
+                    # chunk_size=None yields data as it arrives instead of waiting for 512-byte reads
+                    for line in response.iter_lines(chunk_size=None):
+                        if line:
+                            yield f"data: {line.decode('utf-8')}\n\n"
+                else:
+                    error_data = {
+                        'type': 'error',
+                        'content': f'Agent request failed: {response.status_code}',
+                        'session_id': session_id
+                    }
+                    yield f"data: {json.dumps(error_data)}\n\n"
                 
         except Exception as e:
             logger.error(f"Error in chat: {e}")
@@ -121,7 +166,7 @@ def chat():
             }
             yield f"data: {json.dumps(error_data)}\n\n"
     
-    return Response(generate(), mimetype='text/plain')
+    return Response(generate(), mimetype='text/event-stream')
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=3000)